@@ -1,13 +1,26 @@
 import argparse
+import base64
+import functools
+import hashlib
+import hmac
+import http.client
 import logging
+import math
 import os
+import random
+import socket
 import sys
+import threading
+import time
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import BinaryIO, Callable, Dict, List, Optional, Tuple, Any
+from urllib.parse import parse_qsl, quote, urlencode, urlparse
 
-import boto3
+# requests is imported lazily so the 'get' operation never loads it. boto3 is
+# imported where the S3 client is created; both operations need it, so that only
+# keeps --help and argument errors fast
 from botocore.exceptions import ClientError, NoCredentialsError, ProfileNotFound
-import requests
 
 # Configure logging
 logging.basicConfig(
@@ -16,6 +29,109 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Multipart upload settings (S3 allows at most 10,000 parts of at least 5 MiB each)
+MULTIPART_THRESHOLD = 64 * 1024 * 1024
+DEFAULT_PART_SIZE = 8 * 1024 * 1024
+DEFAULT_MAX_CONCURRENCY = 10
+MAX_PARTS = 10000
+
+# HTTP connection pool settings (pool size covers the multipart worker count)
+HTTP_POOL_CONNECTIONS = 10
+HTTP_POOL_MAXSIZE = 32
+
+# URL schemes whose single-request PUTs are sent with socket.sendfile
+ZEROCOPY_SCHEMES = ('http',)
+
+# Retry settings for transient S3 errors (5xx responses, dropped connections and timeouts).
+# The HTTP adapter only retries failed connection attempts, which send no body; every
+# body transmission goes through one jittered retry loop, so a part is sent at most
+# UPLOAD_MAX_ATTEMPTS times
+RETRYABLE_STATUS_CODES = (500, 502, 503, 504)
+HTTP_CONNECT_RETRIES = 3
+HTTP_BACKOFF_FACTOR = 0.5
+UPLOAD_MAX_ATTEMPTS = 4
+UPLOAD_MAX_BACKOFF = 30
+
+# Presigned URL cache settings: a cached URL is reused for at most this fraction
+# of its lifetime, so callers always get at least half the requested validity
+PRESIGNED_URL_REUSE_FRACTION = 0.5
+PRESIGNED_URL_CACHE_SIZE = 10000
+
+# SigV4 presigned URLs cannot be valid for longer than 7 days
+SIGV4_MAX_EXPIRATION = 7 * 24 * 3600
+
+def _sigv4_signing_key(secret_key: str, date_stamp: str, region: str, service: str) -> bytes:
+    """Derive the AWS Signature Version 4 signing key for a credential scope."""
+    key = ('AWS4' + secret_key).encode('utf-8')
+    for part in (date_stamp, region, service, 'aws4_request'):
+        key = hmac.new(key, part.encode('utf-8'), hashlib.sha256).digest()
+    return key
+
+class _TransientStatusError(Exception):
+    """Raised for a retryable HTTP status from a single-request upload."""
+
+    def __init__(self, status_code: int, body: str):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+        self.body = body
+
+def _is_transient_error(error: Exception) -> bool:
+    """Return True for upload errors worth retrying: 5xx responses, dropped connections and timeouts."""
+    import requests
+
+    if isinstance(error, _TransientStatusError):
+        return True
+    if isinstance(error, requests.exceptions.HTTPError):
+        return error.response is not None and error.response.status_code in RETRYABLE_STATUS_CODES
+    return isinstance(error, (
+        requests.exceptions.ConnectionError,
+        requests.exceptions.Timeout,
+        http.client.HTTPException,
+        ConnectionError,
+        socket.timeout,
+    ))
+
+def _call_with_retries(send: Callable[[], Any], description: str) -> Any:
+    """Call `send`, retrying transient errors with jittered exponential backoff.
+
+    The jitter keeps concurrent workers from retrying in lockstep against a busy
+    S3 partition. The last error is re-raised once attempts are exhausted.
+    """
+    for attempt in range(UPLOAD_MAX_ATTEMPTS):
+        try:
+            return send()
+        except Exception as e:
+            if attempt == UPLOAD_MAX_ATTEMPTS - 1 or not _is_transient_error(e):
+                raise
+            delay = min(UPLOAD_MAX_BACKOFF, 0.5 * 2 ** attempt) + random.random() * 0.1
+            logger.warning(f"Retrying {description} in {delay:.1f}s: {e}")
+            time.sleep(delay)
+
+@functools.lru_cache(maxsize=8)
+def _get_s3_client(
+    profile_name: str,
+    region_name: Optional[str] = None,
+    signature_version: Optional[str] = None
+):
+    """Return a shared S3 client for the given AWS profile, creating it on first use.
+
+    The region and signature version default to botocore's own choice; the batch
+    GET signer asks for a SigV4 client pinned to the bucket's region.
+    """
+    import boto3
+    from botocore.config import Config
+
+    session = boto3.Session(profile_name=profile_name)
+    return session.client(
+        's3',
+        region_name=region_name,
+        config=Config(
+            signature_version=signature_version,
+            max_pool_connections=HTTP_POOL_MAXSIZE,
+            retries={'mode': 'adaptive', 'max_attempts': 5}
+        )
+    )
+
 class S3PresignedUploader:
     """Handle S3 presigned URL generation and file uploads."""
     
@@ -30,8 +146,8 @@ class S3PresignedUploader:
             NoCredentialsError: If AWS credentials are not configured
         """
         try:
-            self.session = boto3.Session(profile_name=profile_name)
-            self.s3_client = self.session.client('s3')
+            self.profile_name = profile_name
+            self.s3_client = _get_s3_client(profile_name)
             logger.info(f"Successfully initialized S3 client with profile: {profile_name}")
         except ProfileNotFound:
             logger.error(f"AWS profile '{profile_name}' not found")
@@ -40,6 +156,103 @@ class S3PresignedUploader:
             logger.error("AWS credentials not configured")
             raise
 
+        # Pooled HTTP session, created on first upload (the lock stops concurrent
+        # part workers from each creating their own)
+        self._http = None
+        self._http_lock = threading.Lock()
+
+        # Bucket regions looked up for SigV4 batch signing (None if unknown)
+        self._bucket_regions: Dict[str, Optional[str]] = {}
+
+        # Presigned URLs keyed by (operation, bucket, key, expiration) -> (value, reuse deadline)
+        self._presigned_cache: Dict[Tuple[str, str, str, int], Tuple[Any, float]] = {}
+
+    @property
+    def http(self):
+        """Pooled requests.Session reused for every upload request."""
+        if self._http is None:
+            with self._http_lock:
+                if self._http is None:
+                    import requests
+                    from requests.adapters import HTTPAdapter
+                    from urllib3.util.retry import Retry
+
+                    session = requests.Session()
+                    adapter = HTTPAdapter(
+                        pool_connections=HTTP_POOL_CONNECTIONS,
+                        pool_maxsize=HTTP_POOL_MAXSIZE,
+                        # Only failed connection attempts are retried here; errors after
+                        # the body was sent are left to _call_with_retries
+                        max_retries=Retry(
+                            total=HTTP_CONNECT_RETRIES,
+                            connect=HTTP_CONNECT_RETRIES,
+                            read=0,
+                            other=0,
+                            backoff_factor=HTTP_BACKOFF_FACTOR
+                        )
+                    )
+                    session.mount('https://', adapter)
+                    session.mount('http://', adapter)
+                    # Publish only once fully configured
+                    self._http = session
+        return self._http
+
+    def close(self) -> None:
+        """Close the pooled HTTP session, if one was created."""
+        with self._http_lock:
+            if self._http is not None:
+                self._http.close()
+                self._http = None
+
+    def __enter__(self) -> 'S3PresignedUploader':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def _cache_get(self, cache_key: Tuple[str, str, str, int]) -> Optional[Any]:
+        """Return a cached presigned value if it is still within its reuse window."""
+        entry = self._presigned_cache.get(cache_key)
+        if entry is None:
+            return None
+        value, reuse_until = entry
+        if time.time() > reuse_until:
+            self._presigned_cache.pop(cache_key, None)
+            return None
+        return value
+
+    def _cache_deadline(self, expiration: int) -> Optional[float]:
+        """Return until when a value signed now may be reused, or None if it must not be cached.
+
+        Reuse is capped at the expiry of temporary credentials, since URLs signed
+        with them stop working when they expire. Temporary credentials of unknown
+        lifetime disable caching. Call this before signing: if the credentials are
+        refreshed during signing, the old (earlier) expiry keeps the cap conservative.
+        """
+        deadline = time.time() + expiration * PRESIGNED_URL_REUSE_FRACTION
+        credentials = self.s3_client._request_signer._credentials
+        if credentials is None:
+            return deadline
+        credential_expiry = getattr(credentials, '_expiry_time', None)
+        if credential_expiry is not None:
+            return min(deadline, credential_expiry.timestamp())
+        if credentials.get_frozen_credentials().token:
+            return None
+        return deadline
+
+    def _cache_put(self, cache_key: Tuple[str, str, str, int], value: Any, reuse_until: Optional[float]) -> None:
+        """Store a presigned value, evicting stale (then oldest) entries when full."""
+        if reuse_until is None:
+            return
+        now = time.time()
+        if len(self._presigned_cache) >= PRESIGNED_URL_CACHE_SIZE:
+            for key, (_, deadline) in list(self._presigned_cache.items()):
+                if now > deadline:
+                    del self._presigned_cache[key]
+            while len(self._presigned_cache) >= PRESIGNED_URL_CACHE_SIZE:
+                self._presigned_cache.pop(next(iter(self._presigned_cache)))
+        self._presigned_cache[cache_key] = (value, reuse_until)
+
     def create_presigned_post(
         self,
         bucket_name: str,
@@ -50,6 +263,9 @@ class S3PresignedUploader:
     ) -> Optional[Dict[str, Any]]:
         """Generate a presigned URL for S3 POST request to upload a file.
 
+        Policies without custom fields or conditions are cached per bucket/key/expiration,
+        so a returned policy may have as little as half of `expiration` left.
+
         Args:
             bucket_name: S3 bucket name
             object_name: S3 object name (key)
@@ -60,6 +276,16 @@ class S3PresignedUploader:
         Returns:
             Dictionary with 'url' and 'fields' keys, or None if error occurs
         """
+        # Only plain policies are cached; custom fields/conditions are signed every time
+        cache_key = ('post', bucket_name, object_name, expiration)
+        cacheable = fields is None and conditions is None
+        if cacheable:
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                logger.info(f"Reusing cached presigned URL for {object_name}")
+                return {'url': cached['url'], 'fields': dict(cached['fields'])}
+
+        reuse_until = self._cache_deadline(expiration) if cacheable else None
         try:
             response = self.s3_client.generate_presigned_post(
                 Bucket=bucket_name,
@@ -69,6 +295,8 @@ class S3PresignedUploader:
                 ExpiresIn=expiration,
             )
             logger.info(f"Successfully generated presigned URL for {object_name}")
+            if cacheable:
+                self._cache_put(cache_key, {'url': response['url'], 'fields': dict(response['fields'])}, reuse_until)
             return response
         except ClientError as e:
             error_code = e.response['Error']['Code']
@@ -83,6 +311,9 @@ class S3PresignedUploader:
     ) -> Optional[str]:
         """Generate a presigned URL for S3 GET request to download a file.
 
+        URLs are cached per bucket/key/expiration, so a returned URL may have been
+        signed earlier and have as little as half of `expiration` left.
+
         Args:
             bucket_name: S3 bucket name
             object_name: S3 object name (key)
@@ -91,6 +322,13 @@ class S3PresignedUploader:
         Returns:
             Presigned URL string, or None if error occurs
         """
+        cache_key = ('get', bucket_name, object_name, expiration)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            logger.info(f"Reusing cached presigned GET URL for {object_name}")
+            return cached
+
+        reuse_until = self._cache_deadline(expiration)
         try:
             response = self.s3_client.generate_presigned_url(
                 'get_object',
@@ -98,12 +336,171 @@ class S3PresignedUploader:
                 ExpiresIn=expiration
             )
             logger.info(f"Successfully generated presigned GET URL for {object_name}")
+            self._cache_put(cache_key, response, reuse_until)
             return response
         except ClientError as e:
             error_code = e.response['Error']['Code']
             logger.error(f"Failed to generate presigned GET URL: {error_code} - {e}")
             return None
 
+    def _bucket_region(self, bucket_name: str) -> Optional[str]:
+        """Return the bucket's region from a HeadBucket call, or None if it can't be determined.
+
+        S3 reports the region in the x-amz-bucket-region header even when access
+        to the bucket is denied, so only a missing header counts as unknown.
+        """
+        if bucket_name not in self._bucket_regions:
+            try:
+                response = self.s3_client.head_bucket(Bucket=bucket_name)
+            except ClientError as e:
+                response = e.response
+            headers = response.get('ResponseMetadata', {}).get('HTTPHeaders', {})
+            self._bucket_regions[bucket_name] = headers.get('x-amz-bucket-region')
+        return self._bucket_regions[bucket_name]
+
+    def _sign_each_get_url(
+        self,
+        bucket_name: str,
+        object_names: List[str],
+        expiration: int
+    ) -> Optional[Dict[str, str]]:
+        """Sign GET URLs one by one with the default client."""
+        urls = {}
+        for object_name in object_names:
+            url = self.create_presigned_get_url(bucket_name, object_name, expiration)
+            if url is None:
+                return None
+            urls[object_name] = url
+        return urls
+
+    def generate_presigned_get_urls(
+        self,
+        bucket_name: str,
+        object_names: List[str],
+        expiration: int = 3600
+    ) -> Optional[Dict[str, str]]:
+        """Generate presigned GET URLs for many objects in the same bucket.
+
+        The URLs are signed with SigV4 by a client pinned to the bucket's region.
+        The first URL is signed by botocore and used as a template: its host,
+        credential scope and timestamp are reused, so the SigV4 signing key is
+        derived once and each further URL costs a single HMAC. Expirations over
+        SigV4's 7-day limit, or buckets whose region can't be determined, fall
+        back to signing each URL with the default client.
+
+        Args:
+            bucket_name: S3 bucket name
+            object_names: S3 object names (keys)
+            expiration: Time in seconds for the presigned URLs to remain valid
+
+        Returns:
+            Dictionary mapping each object name to its presigned URL, or None if error occurs
+        """
+        if not object_names:
+            return {}
+
+        region = self._bucket_region(bucket_name) if expiration <= SIGV4_MAX_EXPIRATION else None
+        if region is None:
+            return self._sign_each_get_url(bucket_name, object_names, expiration)
+
+        sigv4_client = _get_s3_client(self.profile_name, region, 's3v4')
+        try:
+            template = sigv4_client.generate_presigned_url(
+                'get_object',
+                Params={'Bucket': bucket_name, 'Key': object_names[0]},
+                ExpiresIn=expiration
+            )
+        except ClientError as e:
+            error_code = e.response['Error']['Code']
+            logger.error(f"Failed to generate presigned GET URLs: {error_code} - {e}")
+            return None
+
+        parsed = urlparse(template)
+        query = dict(parse_qsl(parsed.query, keep_blank_values=True))
+        quoted_first = quote(object_names[0], safe='/~')
+
+        # Anything other than a plain SigV4 query signature is signed key by key.
+        # So is a batch whose credentials rotated after the template was signed,
+        # since the secret key must match the access key in the template.
+        credentials = sigv4_client._request_signer._credentials.get_frozen_credentials()
+        credential_scope = query.get('X-Amz-Credential', '').split('/')
+        if (
+            query.get('X-Amz-Algorithm') != 'AWS4-HMAC-SHA256'
+            or not parsed.path.endswith(quoted_first)
+            or len(credential_scope) != 5
+            or credential_scope[0] != credentials.access_key
+            or query.get('X-Amz-Security-Token') != credentials.token
+        ):
+            urls = self._sign_each_get_url(bucket_name, object_names[1:], expiration)
+            return None if urls is None else {object_names[0]: template, **urls}
+
+        path_prefix = parsed.path[:len(parsed.path) - len(quoted_first)]
+        _, date_stamp, region, service, _ = credential_scope
+        signing_key = _sigv4_signing_key(credentials.secret_key, date_stamp, region, service)
+        scope = f"{date_stamp}/{region}/{service}/aws4_request"
+
+        del query['X-Amz-Signature']
+        canonical_query = '&'.join(
+            f"{quote(name, safe='-_.~')}={quote(value, safe='-_.~')}"
+            for name, value in sorted(query.items())
+        )
+
+        urls = {}
+        for object_name in object_names:
+            path = path_prefix + quote(object_name, safe='/~')
+            canonical_request = '\n'.join([
+                'GET', path, canonical_query, f"host:{parsed.netloc}\n", 'host', 'UNSIGNED-PAYLOAD'
+            ])
+            string_to_sign = '\n'.join([
+                'AWS4-HMAC-SHA256',
+                query['X-Amz-Date'],
+                scope,
+                hashlib.sha256(canonical_request.encode('utf-8')).hexdigest()
+            ])
+            signature = hmac.new(signing_key, string_to_sign.encode('utf-8'), hashlib.sha256).hexdigest()
+            urls[object_name] = (
+                f"{parsed.scheme}://{parsed.netloc}{path}?"
+                f"{urlencode({**query, 'X-Amz-Signature': signature})}"
+            )
+
+        logger.info(f"Successfully generated {len(urls)} presigned GET URLs for bucket {bucket_name}")
+        return urls
+
+    def create_presigned_put_url(
+        self,
+        bucket_name: str,
+        object_name: str,
+        expiration: int = 3600,
+        content_type: Optional[str] = None
+    ) -> Optional[str]:
+        """Generate a presigned URL for S3 PUT request to upload a file.
+
+        Args:
+            bucket_name: S3 bucket name
+            object_name: S3 object name (key)
+            expiration: Time in seconds for the presigned URL to remain valid
+            content_type: Content-Type the upload must be sent with, if any
+
+        Returns:
+            Presigned URL string, or None if error occurs
+        """
+        params = {'Bucket': bucket_name, 'Key': object_name}
+        if content_type is not None:
+            params['ContentType'] = content_type
+
+        try:
+            response = self.s3_client.generate_presigned_url(
+                'put_object',
+                Params=params,
+                ExpiresIn=expiration
+            )
+            logger.info(f"Successfully generated presigned PUT URL for {object_name}")
+            return response
+        except ClientError as e:
+            error_code = e.response['Error']['Code']
+            logger.error(f"Failed to generate presigned PUT URL: {error_code} - {e}")
+            return None
+
     def upload_file_with_presigned_url(
         self,
         file_path: str,
@@ -122,56 +519,305 @@ class S3PresignedUploader:
         Returns:
             True if upload successful, False otherwise
         """
+        import requests
+
         file_path = Path(file_path)
         
-        # Validate file exists
-        if not file_path.exists():
+        # Validate file exists and get its size with a single stat call
+        try:
+            file_size = os.stat(file_path).st_size
+        except (FileNotFoundError, NotADirectoryError):
             logger.error(f"File not found: {file_path}")
             return False
             
         # Use filename as object name if not specified
         if object_name is None:
             object_name = file_path.name
+
+        # Large files go through concurrent multipart upload
+        if file_size >= MULTIPART_THRESHOLD:
+            return self.upload_file_multipart(
+                file_path=file_path,
+                bucket_name=bucket_name,
+                object_name=object_name,
+                expiration=expiration,
+                file_size=file_size
+            )
             
         logger.info(f"Starting upload of {file_path} to s3://{bucket_name}/{object_name}")
         
         # Generate presigned URL
-        presigned_data = self.create_presigned_post(
+        presigned_url = self.create_presigned_put_url(
             bucket_name=bucket_name,
             object_name=object_name,
             expiration=expiration
         )
         
-        if presigned_data is None:
+        if presigned_url is None:
             logger.error("Failed to generate presigned URL")
             return False
             
-        # Upload file
+        # Upload file: plain-HTTP endpoints use zero-copy sendfile, otherwise
+        # requests streams the open file as the raw request body
         try:
             with open(file_path, 'rb') as f:
-                files = {'file': (object_name, f)}
-                response = requests.post(
-                    presigned_data['url'],
-                    data=presigned_data['fields'],
-                    files=files,
-                    timeout=30
-                )
+                zerocopy = urlparse(presigned_url).scheme in ZEROCOPY_SCHEMES
+
+                def put_file():
+                    if zerocopy:
+                        result = self._upload_put_zerocopy(presigned_url, f, file_size)
+                    else:
+                        f.seek(0)
+                        # An empty file object would make requests add Transfer-Encoding:
+                        # chunked, which S3 rejects on presigned PUTs
+                        response = self.http.put(
+                            presigned_url,
+                            data=f if file_size else b'',
+                            headers={'Content-Length': str(file_size)},
+                            timeout=(10, 30)
+                        )
+                        result = response.status_code, response.text
+                    if result[0] in RETRYABLE_STATUS_CODES:
+                        raise _TransientStatusError(*result)
+                    return result
+
+                status_code, response_text = _call_with_retries(put_file, f"upload of {object_name}")
                 
-            # Check if upload was successful (S3 returns 204 for successful uploads)
-            if response.status_code == 204:
-                logger.info(f"Successfully uploaded {file_path} (HTTP {response.status_code})")
+            # Check if upload was successful (S3 returns 200 for successful PUT uploads)
+            if status_code == 200:
+                logger.info(f"Successfully uploaded {file_path} (HTTP {status_code})")
                 return True
             else:
-                logger.error(f"Upload failed with HTTP status {response.status_code}: {response.text}")
+                logger.error(f"Upload failed with HTTP status {status_code}: {response_text}")
                 return False
                 
-        except requests.exceptions.RequestException as e:
+        except _TransientStatusError as e:
+            logger.error(f"Upload failed with HTTP status {e.status_code}: {e.body}")
+            return False
+        except (requests.exceptions.RequestException, http.client.HTTPException,
+                ConnectionError, socket.timeout, socket.gaierror) as e:
             logger.error(f"Network error during upload: {e}")
             return False
         except IOError as e:
             logger.error(f"File I/O error: {e}")
             return False
 
+    def _upload_put_zerocopy(self, url: str, f: BinaryIO, file_size: int) -> Tuple[int, str]:
+        """PUT a file to a plain-HTTP presigned URL using socket.sendfile.
+
+        The body is sent straight from the page cache to the socket (os.sendfile
+        on Linux; socket.sendfile falls back to regular sends elsewhere).
+
+        Returns:
+            Tuple of (HTTP status code, response body)
+
+        Raises:
+            ConnectionError: If the connection is refused or dropped
+            socket.timeout: If the connection or transfer times out
+            socket.gaierror: If the endpoint host cannot be resolved
+            http.client.HTTPException: If the response cannot be parsed
+        """
+        parsed = urlparse(url)
+        target = parsed.path or '/'
+        if parsed.query:
+            target += f"?{parsed.query}"
+
+        request_head = (
+            f"PUT {target} HTTP/1.1\r\n"
+            f"Host: {parsed.netloc}\r\n"
+            f"Content-Length: {file_size}\r\n"
+            "Connection: close\r\n"
+            "\r\n"
+        )
+
+        with socket.create_connection((parsed.hostname, parsed.port or 80), timeout=30) as sock:
+            sock.sendall(request_head.encode('ascii'))
+            # socket.sendfile rejects count=0, and an empty file has no body to send
+            if file_size:
+                sent = sock.sendfile(f, offset=0, count=file_size)
+                if sent != file_size:
+                    raise IOError(f"Sent {sent} of {file_size} bytes")
+
+            response = http.client.HTTPResponse(sock)
+            try:
+                response.begin()
+                return response.status, response.read().decode('utf-8', errors='replace')
+            finally:
+                response.close()
+
+    def _upload_part(
+        self,
+        file_path: Path,
+        bucket_name: str,
+        object_name: str,
+        upload_id: str,
+        part_number: int,
+        part_size: int,
+        expiration: int
+    ) -> Dict[str, Any]:
+        """Upload a single part of a multipart upload using a presigned URL.
+
+        Each call opens its own file handle so parts can be read concurrently,
+        and sends a Content-MD5 header so S3 verifies the part's integrity.
+
+        Returns:
+            Dictionary with 'PartNumber' and 'ETag' keys
+
+        Raises:
+            ClientError: If the presigned URL cannot be generated
+            requests.exceptions.RequestException: If the upload request fails
+            IOError: If the file cannot be read
+        """
+        url = self.s3_client.generate_presigned_url(
+            'upload_part',
+            Params={
+                'Bucket': bucket_name,
+                'Key': object_name,
+                'UploadId': upload_id,
+                'PartNumber': part_number,
+            },
+            ExpiresIn=expiration
+        )
+
+        with open(file_path, 'rb') as f:
+            f.seek((part_number - 1) * part_size)
+            data = f.read(part_size)
+
+        # Hash in the worker so it overlaps with other parts' network I/O
+        # (hashlib releases the GIL for large buffers)
+        content_md5 = base64.b64encode(hashlib.md5(data).digest()).decode('ascii')
+
+        def put_part():
+            part_response = self.http.put(url, data=data, headers={'Content-MD5': content_md5}, timeout=30)
+            part_response.raise_for_status()
+            return part_response
+
+        response = _call_with_retries(put_part, f"part {part_number} of {object_name}")
+
+        logger.info(f"Uploaded part {part_number} of {object_name} (HTTP {response.status_code})")
+        return {'PartNumber': part_number, 'ETag': response.headers['ETag']}
+
+    def upload_file_multipart(
+        self,
+        file_path: str,
+        bucket_name: str,
+        object_name: Optional[str] = None,
+        part_size: int = DEFAULT_PART_SIZE,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        expiration: int = 3600,
+        file_size: Optional[int] = None
+    ) -> bool:
+        """Upload a file using S3 multipart upload with presigned part URLs.
+
+        Parts are uploaded concurrently; the first failure cancels the parts not
+        yet started and aborts the multipart upload.
+
+        Args:
+            file_path: Path to the file to upload
+            bucket_name: S3 bucket name
+            object_name: S3 object name (defaults to filename)
+            part_size: Size in bytes of each part (raised if needed to stay within S3's part limit)
+            max_concurrency: Maximum number of parts uploaded in parallel
+            expiration: Time in seconds for each presigned part URL to remain valid
+            file_size: Size of the file in bytes, if already known (skips a stat call)
+
+        Returns:
+            True if upload successful, False otherwise
+        """
+        import requests
+
+        file_path = Path(file_path)
+
+        if file_size is None:
+            try:
+                file_size = os.stat(file_path).st_size
+            except (FileNotFoundError, NotADirectoryError):
+                logger.error(f"File not found: {file_path}")
+                return False
+
+        if object_name is None:
+            object_name = file_path.name
+
+        part_size = max(part_size, math.ceil(file_size / MAX_PARTS))
+        part_count = max(1, math.ceil(file_size / part_size))
+
+        logger.info(
+            f"Starting multipart upload of {file_path} to s3://{bucket_name}/{object_name} "
+            f"({part_count} parts, {max_concurrency} workers)"
+        )
+
+        try:
+            upload_id = self.s3_client.create_multipart_upload(
+                Bucket=bucket_name,
+                Key=object_name
+            )['UploadId']
+        except ClientError as e:
+            error_code = e.response['Error']['Code']
+            logger.error(f"Failed to create multipart upload: {error_code} - {e}")
+            return False
+
+        completed = False
+        try:
+            executor = ThreadPoolExecutor(max_workers=max_concurrency)
+            futures = []
+            try:
+                futures = [
+                    executor.submit(
+                        self._upload_part,
+                        file_path,
+                        bucket_name,
+                        object_name,
+                        upload_id,
+                        part_number,
+                        part_size,
+                        expiration
+                    )
+                    for part_number in range(1, part_count + 1)
+                ]
+                done, _ = wait(futures, return_when=FIRST_EXCEPTION)
+                for future in done:
+                    if future.exception() is not None:
+                        raise future.exception()
+                parts = [future.result() for future in futures]
+            finally:
+                # On failure, drop queued parts and only wait for those already in flight
+                for future in futures:
+                    future.cancel()
+                executor.shutdown(wait=True)
+
+            parts.sort(key=lambda part: part['PartNumber'])
+            self.s3_client.complete_multipart_upload(
+                Bucket=bucket_name,
+                Key=object_name,
+                UploadId=upload_id,
+                MultipartUpload={'Parts': parts}
+            )
+            completed = True
+            logger.info(f"Successfully uploaded {file_path} in {part_count} parts")
+            return True
+
+        except ClientError as e:
+            error_code = e.response['Error']['Code']
+            logger.error(f"Multipart upload failed: {error_code} - {e}")
+            return False
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Network error during multipart upload: {e}")
+            return False
+        except IOError as e:
+            logger.error(f"File I/O error: {e}")
+            return False
+        finally:
+            if not completed:
+                try:
+                    self.s3_client.abort_multipart_upload(
+                        Bucket=bucket_name,
+                        Key=object_name,
+                        UploadId=upload_id
+                    )
+                    logger.info(f"Aborted multipart upload {upload_id}")
+                except ClientError as e:
+                    logger.error(f"Failed to abort multipart upload {upload_id}: {e}")
+
 def create_argument_parser() -> argparse.ArgumentParser:
     """Create and configure the argument parser."""
     parser = argparse.ArgumentParser(
@@ -194,7 +840,7 @@ Examples:
     subparsers.required = True
     
     # POST operation (upload)
-    post_parser = subparsers.add_parser('post', help='Upload file using presigned POST URL')
+    post_parser = subparsers.add_parser('post', help='Upload file using presigned PUT URL')
     post_parser.add_argument('--bucket', '-b', required=True, help='S3 bucket name')
     post_parser.add_argument('--file', '-f', required=True, help='File path to upload')
     post_parser.add_argument('--key', '-k', help='S3 object key (defaults to filename)')
@@ -259,13 +905,12 @@ def main():
     
     try:
         # Initialize uploader
-        uploader = S3PresignedUploader(profile_name=args.profile)
-        
-        # Handle operations
-        if args.operation == 'post':
-            handle_post_operation(args, uploader)
-        elif args.operation == 'get':
-            handle_get_operation(args, uploader)
+        with S3PresignedUploader(profile_name=args.profile) as uploader:
+            # Handle operations
+            if args.operation == 'post':
+                handle_post_operation(args, uploader)
+            elif args.operation == 'get':
+                handle_get_operation(args, uploader)
             
     except (ProfileNotFound, NoCredentialsError) as e:
         logger.error(f"AWS configuration error: {e}")
@@ -0,0 +1,209 @@
+import asyncio
+import logging
+from contextlib import AsyncExitStack
+from pathlib import Path
+from typing import Dict, List, Optional, Any
+
+import aiohttp
+from aiobotocore.session import get_session
+from botocore.exceptions import ClientError, NoCredentialsError, ProfileNotFound
+
+logger = logging.getLogger(__name__)
+
+# Concurrency settings for batch uploads
+DEFAULT_MAX_CONCURRENCY = 16
+HTTP_CONNECTION_LIMIT = 32
+
+# No overall deadline, so large uploads are not cut off; only stalled
+# connects and responses time out
+HTTP_TIMEOUT = aiohttp.ClientTimeout(total=None, sock_connect=10, sock_read=60)
+
+class AsyncS3PresignedUploader:
+    """Handle S3 presigned URL generation and concurrent file uploads with asyncio.
+
+    Use as an async context manager so the S3 client and HTTP session are
+    opened and closed together:
+
+        async with AsyncS3PresignedUploader('default') as uploader:
+            results = await uploader.upload_many(['a.jpg', 'b.jpg'], 'my-bucket')
+    """
+
+    def __init__(self, profile_name: str = 'default', max_concurrency: int = DEFAULT_MAX_CONCURRENCY):
+        """Store the configuration; clients are created on context entry.
+
+        Args:
+            profile_name: AWS profile name to use for authentication
+            max_concurrency: Maximum number of uploads in flight at once
+        """
+        self.profile_name = profile_name
+        self.max_concurrency = max_concurrency
+        self.s3_client = None
+        self.http: Optional[aiohttp.ClientSession] = None
+        self._exit_stack: Optional[AsyncExitStack] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    async def __aenter__(self) -> 'AsyncS3PresignedUploader':
+        """Create the S3 client and pooled HTTP session.
+
+        Raises:
+            ProfileNotFound: If the specified AWS profile doesn't exist
+            NoCredentialsError: If AWS credentials are not configured
+        """
+        self._exit_stack = AsyncExitStack()
+        try:
+            session = get_session()
+            session.set_config_variable('profile', self.profile_name)
+            self.s3_client = await self._exit_stack.enter_async_context(session.create_client('s3'))
+            self.http = await self._exit_stack.enter_async_context(
+                aiohttp.ClientSession(
+                    connector=aiohttp.TCPConnector(limit=HTTP_CONNECTION_LIMIT),
+                    timeout=HTTP_TIMEOUT
+                )
+            )
+            logger.info(f"Successfully initialized async S3 client with profile: {self.profile_name}")
+        except ProfileNotFound:
+            logger.error(f"AWS profile '{self.profile_name}' not found")
+            await self._exit_stack.aclose()
+            raise
+        except NoCredentialsError:
+            logger.error("AWS credentials not configured")
+            await self._exit_stack.aclose()
+            raise
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self._exit_stack.aclose()
+
+    async def create_presigned_post(
+        self,
+        bucket_name: str,
+        object_name: str,
+        fields: Optional[Dict[str, str]] = None,
+        conditions: Optional[List[Any]] = None,
+        expiration: int = 3600
+    ) -> Optional[Dict[str, Any]]:
+        """Generate a presigned URL for S3 POST request to upload a file.
+
+        Args:
+            bucket_name: S3 bucket name
+            object_name: S3 object name (key)
+            fields: Dictionary of prefilled form fields
+            conditions: List of conditions to include in the policy
+            expiration: Time in seconds for the presigned URL to remain valid
+
+        Returns:
+            Dictionary with 'url' and 'fields' keys, or None if error occurs
+        """
+        try:
+            response = await self.s3_client.generate_presigned_post(
+                Bucket=bucket_name,
+                Key=object_name,
+                Fields=fields,
+                Conditions=conditions,
+                ExpiresIn=expiration,
+            )
+            logger.info(f"Successfully generated presigned URL for {object_name}")
+            return response
+        except ClientError as e:
+            error_code = e.response['Error']['Code']
+            logger.error(f"Failed to generate presigned URL: {error_code} - {e}")
+            return None
+
+    async def upload(
+        self,
+        file_path: str,
+        bucket_name: str,
+        object_name: Optional[str] = None,
+        expiration: int = 3600
+    ) -> bool:
+        """Upload a file using a presigned POST URL.
+
+        Args:
+            file_path: Path to the file to upload
+            bucket_name: S3 bucket name
+            object_name: S3 object name (defaults to filename)
+            expiration: Time in seconds for the presigned URL to remain valid
+
+        Returns:
+            True if upload successful, False otherwise
+        """
+        file_path = Path(file_path)
+
+        if not file_path.exists():
+            logger.error(f"File not found: {file_path}")
+            return False
+
+        if object_name is None:
+            object_name = file_path.name
+
+        logger.info(f"Starting upload of {file_path} to s3://{bucket_name}/{object_name}")
+
+        presigned_data = await self.create_presigned_post(
+            bucket_name=bucket_name,
+            object_name=object_name,
+            expiration=expiration
+        )
+
+        if presigned_data is None:
+            logger.error("Failed to generate presigned URL")
+            return False
+
+        try:
+            with open(file_path, 'rb') as f:
+                # S3 requires the file to be the last form field
+                form = aiohttp.FormData()
+                for name, value in presigned_data['fields'].items():
+                    form.add_field(name, value)
+                form.add_field('file', f, filename=object_name)
+
+                async with self.http.post(presigned_data['url'], data=form) as response:
+                    if response.status == 204:
+                        logger.info(f"Successfully uploaded {file_path} (HTTP {response.status})")
+                        return True
+                    body = await response.text()
+                    logger.error(f"Upload failed with HTTP status {response.status}: {body}")
+                    return False
+
+        except aiohttp.ClientError as e:
+            logger.error(f"Network error during upload: {e}")
+            return False
+        except asyncio.TimeoutError:
+            logger.error(f"Upload of {file_path} timed out")
+            return False
+        except IOError as e:
+            logger.error(f"File I/O error: {e}")
+            return False
+
+    async def _throttled_upload(self, file_path: str, bucket_name: str, expiration: int) -> bool:
+        async with self._semaphore:
+            return await self.upload(file_path, bucket_name, expiration=expiration)
+
+    async def upload_many(
+        self,
+        file_paths: List[str],
+        bucket_name: str,
+        expiration: int = 3600
+    ) -> List[bool]:
+        """Upload several files concurrently, keyed by filename.
+
+        At most ``max_concurrency`` uploads are in flight at any time. An
+        unexpected error in one upload is logged and reported as False without
+        affecting the others.
+
+        Args:
+            file_paths: Paths of the files to upload
+            bucket_name: S3 bucket name
+            expiration: Time in seconds for each presigned URL to remain valid
+
+        Returns:
+            List of upload results in the same order as ``file_paths``
+        """
+        results = await asyncio.gather(
+            *[self._throttled_upload(path, bucket_name, expiration) for path in file_paths],
+            return_exceptions=True
+        )
+        for path, result in zip(file_paths, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Unexpected error uploading {path}: {result}")
+        return [result is True for result in results]
@@ -0,0 +1,347 @@
+import datetime
+import os
+import socket
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+from urllib.parse import parse_qs, urlparse
+
+import boto3
+import requests
+from botocore.config import Config
+from botocore.credentials import ReadOnlyCredentials
+from botocore.exceptions import ClientError
+
+import app
+
+FROZEN_NOW = datetime.datetime(2026, 10, 15, 12, 0, 0)
+KEYS = ['a.jpg', 'dir/sub dir/ü+x~y.png', 'weird&=?#key', '%41 ~ *']
+
+
+def url_parts(url: str):
+    parsed = urlparse(url)
+    return parsed.scheme, parsed.netloc, parsed.path, parse_qs(parsed.query)
+
+
+class StubS3Server(ThreadingHTTPServer):
+    """Local HTTP server that records PUTs and answers with queued status codes (then 200)."""
+
+    def __init__(self, statuses=()):
+        super().__init__(('127.0.0.1', 0), StubS3Handler)
+        self.statuses = list(statuses)
+        self.requests = []
+        self.lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_port}"
+
+
+class StubS3Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_PUT(self):
+        body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        with self.server.lock:
+            self.server.requests.append({'path': self.path, 'headers': dict(self.headers), 'body': body})
+            status = self.server.statuses.pop(0) if self.server.statuses else 200
+        self.send_response(status)
+        self.send_header('ETag', f'"etag-{len(body)}"')
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+class UploadTestCase(unittest.TestCase):
+    """Base class providing a stub S3 endpoint, temporary files and an uploader."""
+
+    def start_server(self, statuses=()) -> StubS3Server:
+        server = StubS3Server(statuses)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        return server
+
+    def make_file(self, content: bytes) -> str:
+        handle, path = tempfile.mkstemp()
+        with os.fdopen(handle, 'wb') as f:
+            f.write(content)
+        self.addCleanup(os.remove, path)
+        return path
+
+    def make_uploader(self, put_url: str) -> app.S3PresignedUploader:
+        with mock.patch('app._get_s3_client', return_value=mock.Mock()):
+            uploader = app.S3PresignedUploader()
+        uploader.create_presigned_put_url = mock.Mock(return_value=put_url)
+        self.addCleanup(uploader.close)
+        return uploader
+
+
+class PlainHttpPutUploadTest(UploadTestCase):
+    """Single-request uploads to http:// endpoints go through the sendfile path."""
+
+    def test_uploads_small_and_empty_files(self):
+        for content in (b'', b'x', b'hello world' * 1000):
+            with self.subTest(size=len(content)):
+                server = self.start_server()
+                uploader = self.make_uploader(f"{server.url}/bucket/key?X-Amz-Signature=abc")
+                with mock.patch.object(uploader.http, 'put') as requests_put:
+                    self.assertTrue(uploader.upload_file_with_presigned_url(self.make_file(content), 'bucket', 'key'))
+
+                requests_put.assert_not_called()
+                self.assertEqual(len(server.requests), 1)
+                request = server.requests[0]
+                self.assertEqual(request['path'], '/bucket/key?X-Amz-Signature=abc')
+                self.assertEqual(request['headers']['Content-Length'], str(len(content)))
+                self.assertEqual(request['body'], content)
+
+
+@mock.patch('app.time.sleep')
+class PutUploadRetryTest(UploadTestCase):
+    """Single-request uploads retry 5xx responses with the body rewound, on both PUT paths."""
+
+    def upload(self, statuses, content=b'hello world', zerocopy=True):
+        server = self.start_server(statuses)
+        uploader = self.make_uploader(f"{server.url}/bucket/key?X-Amz-Signature=abc")
+        schemes = app.ZEROCOPY_SCHEMES if zerocopy else ()
+        with mock.patch('app.ZEROCOPY_SCHEMES', schemes):
+            result = uploader.upload_file_with_presigned_url(self.make_file(content), 'bucket', 'key')
+        return result, server.requests
+
+    def test_retries_503_then_succeeds_with_full_body(self, sleep):
+        for zerocopy in (True, False):
+            with self.subTest(zerocopy=zerocopy):
+                result, requests = self.upload([503], zerocopy=zerocopy)
+                self.assertTrue(result)
+                self.assertEqual([request['body'] for request in requests], [b'hello world'] * 2)
+        self.assertEqual(sleep.call_count, 2)
+
+    def test_does_not_retry_403(self, sleep):
+        for zerocopy in (True, False):
+            with self.subTest(zerocopy=zerocopy):
+                result, requests = self.upload([403], zerocopy=zerocopy)
+                self.assertFalse(result)
+                self.assertEqual(len(requests), 1)
+        sleep.assert_not_called()
+
+    def test_gives_up_after_max_attempts(self, sleep):
+        result, requests = self.upload([503] * app.UPLOAD_MAX_ATTEMPTS, zerocopy=False)
+        self.assertFalse(result)
+        self.assertEqual(len(requests), app.UPLOAD_MAX_ATTEMPTS)
+        self.assertEqual(sleep.call_count, app.UPLOAD_MAX_ATTEMPTS - 1)
+
+    def test_empty_file_is_not_chunked(self, _):
+        result, requests = self.upload([], content=b'', zerocopy=False)
+        self.assertTrue(result)
+        self.assertEqual(requests[0]['headers']['Content-Length'], '0')
+        self.assertNotIn('Transfer-Encoding', requests[0]['headers'])
+
+
+@mock.patch('app.time.sleep')
+class MultipartUploadTest(UploadTestCase):
+    """Multipart uploads PUT every part, then complete, or abort on the first failure."""
+
+    def upload(self, statuses, content, part_size=4, max_concurrency=3):
+        server = self.start_server(statuses)
+        uploader = self.make_uploader(None)
+        uploader.s3_client.create_multipart_upload.return_value = {'UploadId': 'upload-1'}
+        uploader.s3_client.generate_presigned_url.side_effect = (
+            lambda operation, Params, ExpiresIn: f"{server.url}/bucket/key?partNumber={Params['PartNumber']}"
+        )
+        result = uploader.upload_file_multipart(
+            self.make_file(content), 'bucket', 'key', part_size=part_size, max_concurrency=max_concurrency
+        )
+        return result, uploader.s3_client, server.requests
+
+    def test_uploads_parts_and_completes_in_order(self, _):
+        content = b'abcdefghijklmnopqrstuvw'
+        result, s3_client, requests = self.upload([], content)
+
+        self.assertTrue(result)
+        bodies = sorted((int(parse_qs(urlparse(r['path']).query)['partNumber'][0]), r['body']) for r in requests)
+        self.assertEqual(b''.join(body for _, body in bodies), content)
+        self.assertTrue(all('Content-MD5' in r['headers'] for r in requests))
+        s3_client.complete_multipart_upload.assert_called_once_with(
+            Bucket='bucket', Key='key', UploadId='upload-1',
+            MultipartUpload={'Parts': [
+                {'PartNumber': n, 'ETag': f'"etag-{len(body)}"'} for n, body in bodies
+            ]}
+        )
+        s3_client.abort_multipart_upload.assert_not_called()
+
+    def test_retries_transient_part_failure(self, sleep):
+        result, s3_client, requests = self.upload([503], b'abcdefgh', max_concurrency=1)
+        self.assertTrue(result)
+        self.assertEqual(len(requests), 3)
+        sleep.assert_called_once()
+        s3_client.complete_multipart_upload.assert_called_once()
+
+    def test_permanent_part_failure_aborts_without_sending_queued_parts(self, sleep):
+        part_count = 50
+        result, s3_client, requests = self.upload([400], b'x' * 4 * part_count, max_concurrency=2)
+        self.assertFalse(result)
+        self.assertLess(len(requests), part_count)
+        sleep.assert_not_called()
+        s3_client.complete_multipart_upload.assert_not_called()
+        s3_client.abort_multipart_upload.assert_called_once_with(Bucket='bucket', Key='key', UploadId='upload-1')
+
+
+class IsTransientErrorTest(unittest.TestCase):
+    """Only 5xx responses, dropped connections and timeouts are retried."""
+
+    def http_error(self, status_code: int) -> requests.exceptions.HTTPError:
+        response = requests.Response()
+        response.status_code = status_code
+        return requests.exceptions.HTTPError(response=response)
+
+    def test_transient(self):
+        for error in (
+            app._TransientStatusError(503, ''),
+            self.http_error(500),
+            requests.exceptions.ConnectionError(),
+            requests.exceptions.ReadTimeout(),
+            ConnectionResetError(),
+            socket.timeout(),
+        ):
+            with self.subTest(error=error):
+                self.assertTrue(app._is_transient_error(error))
+
+    def test_permanent(self):
+        for error in (self.http_error(403), self.http_error(404), FileNotFoundError(), ValueError()):
+            with self.subTest(error=error):
+                self.assertFalse(app._is_transient_error(error))
+
+
+@mock.patch('botocore.auth.get_current_datetime', return_value=FROZEN_NOW)
+class GeneratePresignedGetUrlsTest(unittest.TestCase):
+    """generate_presigned_get_urls() must produce exactly what botocore signs."""
+
+    def make_uploader(self, region: str, session_token: str = 'token/with+chars=') -> app.S3PresignedUploader:
+        """Build an uploader whose clients are all one SigV4 client with static test credentials."""
+        client = boto3.Session(
+            aws_access_key_id='AKIDEXAMPLE',
+            aws_secret_access_key='secret',
+            aws_session_token=session_token,
+            region_name=region,
+        ).client('s3', config=Config(signature_version='s3v4'))
+        patcher = mock.patch('app._get_s3_client', return_value=client)
+        self.get_s3_client = patcher.start()
+        self.addCleanup(patcher.stop)
+        uploader = app.S3PresignedUploader()
+        uploader._bucket_region = mock.Mock(return_value=region)
+        return uploader
+
+    def assert_matches_botocore(self, uploader, bucket, urls):
+        for key in KEYS:
+            expected = uploader.s3_client.generate_presigned_url(
+                'get_object', Params={'Bucket': bucket, 'Key': key}, ExpiresIn=900
+            )
+            self.assertEqual(url_parts(urls[key]), url_parts(expected), key)
+
+    def test_matches_botocore(self, _):
+        for region in ('eu-west-1', 'us-east-1'):
+            for bucket in ('my-bucket', 'My_Bucket.dots'):
+                with self.subTest(region=region, bucket=bucket):
+                    uploader = self.make_uploader(region)
+                    urls = uploader.generate_presigned_get_urls(bucket, KEYS, expiration=900)
+                    self.assert_matches_botocore(uploader, bucket, urls)
+                    self.get_s3_client.assert_called_with('default', region, 's3v4')
+
+    def test_matches_botocore_without_session_token(self, _):
+        uploader = self.make_uploader('eu-west-1', session_token=None)
+        urls = uploader.generate_presigned_get_urls('my-bucket', KEYS, expiration=900)
+        self.assert_matches_botocore(uploader, 'my-bucket', urls)
+
+    def test_rotated_credentials_fall_back_to_per_key_signing(self, _):
+        uploader = self.make_uploader('eu-west-1')
+        credentials = uploader.s3_client._request_signer._credentials
+        original = credentials.get_frozen_credentials()
+        rotated = ReadOnlyCredentials('AKIDROTATED', 'other-secret', 'other-token')
+        sign = uploader.s3_client.generate_presigned_url
+        state = {'rotated': False}
+
+        def sign_then_rotate(*args, **kwargs):
+            url = sign(*args, **kwargs)
+            state['rotated'] = True
+            return url
+
+        with mock.patch.object(uploader.s3_client, 'generate_presigned_url', side_effect=sign_then_rotate), \
+                mock.patch.object(credentials, 'get_frozen_credentials',
+                                  side_effect=lambda: rotated if state['rotated'] else original), \
+                mock.patch.object(uploader, 'create_presigned_get_url', return_value='signed') as per_key:
+            urls = uploader.generate_presigned_get_urls('my-bucket', KEYS, expiration=900)
+
+        self.assertEqual(per_key.call_count, len(KEYS) - 1)
+        self.assertEqual([urls[key] for key in KEYS[1:]], ['signed'] * (len(KEYS) - 1))
+
+    def test_expiration_over_seven_days_falls_back_to_per_key_signing(self, _):
+        uploader = self.make_uploader('eu-west-1')
+        with mock.patch.object(uploader, 'create_presigned_get_url', return_value='signed') as per_key:
+            urls = uploader.generate_presigned_get_urls('my-bucket', KEYS, expiration=app.SIGV4_MAX_EXPIRATION + 1)
+
+        self.assertEqual(urls, dict.fromkeys(KEYS, 'signed'))
+        per_key.assert_called_with('my-bucket', KEYS[-1], app.SIGV4_MAX_EXPIRATION + 1)
+        uploader._bucket_region.assert_not_called()
+        self.get_s3_client.assert_called_once_with('default')
+
+    def test_unknown_region_falls_back_to_per_key_signing(self, _):
+        uploader = self.make_uploader('eu-west-1')
+        uploader._bucket_region.return_value = None
+        with mock.patch.object(uploader, 'create_presigned_get_url', return_value='signed') as per_key:
+            urls = uploader.generate_presigned_get_urls('my-bucket', KEYS, expiration=900)
+
+        self.assertEqual(urls, dict.fromkeys(KEYS, 'signed'))
+        self.assertEqual(per_key.call_count, len(KEYS))
+        self.get_s3_client.assert_called_once_with('default')
+
+    def test_empty_key_list(self, _):
+        self.assertEqual(self.make_uploader('eu-west-1').generate_presigned_get_urls('my-bucket', []), {})
+
+
+class BucketRegionTest(unittest.TestCase):
+    """_bucket_region() reads the region S3 reports for a bucket and caches it."""
+
+    def make_uploader(self, head_bucket) -> app.S3PresignedUploader:
+        with mock.patch('app._get_s3_client', return_value=mock.Mock()):
+            uploader = app.S3PresignedUploader()
+        uploader.s3_client.head_bucket = head_bucket
+        return uploader
+
+    def error(self, code: str, headers) -> ClientError:
+        return ClientError({'Error': {'Code': code}, 'ResponseMetadata': {'HTTPHeaders': headers}}, 'HeadBucket')
+
+    def test_reads_region_header(self):
+        head_bucket = mock.Mock(return_value={
+            'ResponseMetadata': {'HTTPHeaders': {'x-amz-bucket-region': 'eu-central-1'}}
+        })
+        uploader = self.make_uploader(head_bucket)
+        self.assertEqual(uploader._bucket_region('my-bucket'), 'eu-central-1')
+        self.assertEqual(uploader._bucket_region('my-bucket'), 'eu-central-1')
+        head_bucket.assert_called_once_with(Bucket='my-bucket')
+
+    def test_reads_region_header_from_access_denied(self):
+        uploader = self.make_uploader(mock.Mock(side_effect=self.error('403', {'x-amz-bucket-region': 'ap-south-1'})))
+        self.assertEqual(uploader._bucket_region('my-bucket'), 'ap-south-1')
+
+    def test_missing_header_is_unknown(self):
+        uploader = self.make_uploader(mock.Mock(side_effect=self.error('404', {})))
+        self.assertIsNone(uploader._bucket_region('my-bucket'))
+
+
+class GetS3ClientTest(unittest.TestCase):
+    """The shared client keeps botocore's default signature version and region."""
+
+    def test_default_client_does_not_force_sigv4(self):
+        with mock.patch('boto3.Session') as session:
+            app._get_s3_client.__wrapped__('default')
+        _, kwargs = session.return_value.client.call_args
+        self.assertIsNone(kwargs['region_name'])
+        self.assertIsNone(kwargs['config'].signature_version)
+
+
+if __name__ == '__main__':
+    unittest.main()